@@ -1,13 +1,16 @@
 use std::cell::RefCell;
 use std::ffi::CString;
 use std::fmt::Display;
-use std::ptr::copy_nonoverlapping;
 use std::slice;
 
+use half::f16;
 use libc::{c_char, size_t};
 use nalgebra::{Vector2, Vector3};
+use rayon::prelude::*;
 
-use asdfspline::{AsdfPosSpline, MonotoneCubicSpline, NormWrapper, PiecewiseCubicCurve, Spline};
+use asdfspline::{
+    AsdfPosSpline, MonotoneCubicSpline, NormWrapper, PiecewiseCubicCurve, Spline, Vector,
+};
 
 thread_local! {
     static LAST_ERROR: RefCell<CString> = RefCell::new(CString::new("no error").unwrap());
@@ -55,6 +58,134 @@ pub type AsdfCubicCurve2 = PiecewiseCubicCurve<Vec2>;
 pub type AsdfCubicCurve1 = PiecewiseCubicCurve<f32>;
 pub type AsdfMonotoneCubic = MonotoneCubicSpline;
 
+/// Pointer to (and number of) grid elements.
+#[repr(C)]
+pub struct AsdfGrid {
+    pub data: *const f32,
+    pub len: size_t,
+}
+
+impl From<&[f32]> for AsdfGrid {
+    fn from(grid: &[f32]) -> AsdfGrid {
+        AsdfGrid {
+            data: grid.as_ptr(),
+            len: grid.len(),
+        }
+    }
+}
+
+/// Below this number of elements, evaluation is done on the calling thread.
+const PARALLEL_THRESHOLD: usize = 1024;
+
+/// Number of elements evaluated by one parallel work item.
+const PARALLEL_CHUNK_SIZE: usize = 1024;
+
+/// Evaluates `curve` at `count` elements of `times`,
+/// `write` stores each result in `dim` elements of `output`.
+///
+/// If `parallel` is `true`, large inputs are split into chunks
+/// which are evaluated in parallel.
+unsafe fn evaluate_into<S, V, T, F>(
+    curve: &S,
+    times: *const f32,
+    count: usize,
+    output: *mut T,
+    dim: usize,
+    parallel: bool,
+    write: F,
+) where
+    S: Spline<V> + Sync,
+    T: Send,
+    F: Fn(V, &mut [T]) + Sync,
+{
+    if count == 0 {
+        return;
+    }
+    let times = slice::from_raw_parts(times, count);
+    let output = slice::from_raw_parts_mut(output, count * dim);
+    let evaluate_chunk = |(times, output): (&[f32], &mut [T])| {
+        for (&t, out) in times.iter().zip(output.chunks_exact_mut(dim)) {
+            write(curve.evaluate(t), out);
+        }
+    };
+    if !parallel || count < PARALLEL_THRESHOLD {
+        evaluate_chunk((times, output));
+    } else {
+        times
+            .par_chunks(PARALLEL_CHUNK_SIZE)
+            .zip(output.par_chunks_mut(PARALLEL_CHUNK_SIZE * dim))
+            .for_each(evaluate_chunk);
+    }
+}
+
+/// Evaluates each of the `curve_count` `curves` at the same `count` elements of `times`,
+/// `write` stores each result in `dim` elements of `output`.
+///
+/// If `parallel` is `true`, the curves are evaluated in parallel.
+#[allow(clippy::too_many_arguments)]
+unsafe fn evaluate_batch_into<S, V, F>(
+    curves: *const &S,
+    curve_count: usize,
+    times: *const f32,
+    count: usize,
+    output: *mut f32,
+    dim: usize,
+    parallel: bool,
+    write: F,
+) where
+    S: Spline<V> + Sync,
+    F: Fn(V, &mut [f32]) + Sync,
+{
+    if curve_count == 0 || count == 0 {
+        return;
+    }
+    let curves = slice::from_raw_parts(curves, curve_count);
+    let times = slice::from_raw_parts(times, count);
+    let output = slice::from_raw_parts_mut(output, curve_count * count * dim);
+    let evaluate_curve = |(curve, output): (&&S, &mut [f32])| {
+        for (&t, out) in times.iter().zip(output.chunks_exact_mut(dim)) {
+            write(curve.evaluate(t), out);
+        }
+    };
+    if parallel {
+        curves
+            .par_iter()
+            .zip(output.par_chunks_mut(count * dim))
+            .for_each(evaluate_curve);
+    } else {
+        curves
+            .iter()
+            .zip(output.chunks_mut(count * dim))
+            .for_each(evaluate_curve);
+    }
+}
+
+/// Evaluates `curve` at `n` equally spaced points per segment plus the end point,
+/// storing each result in `dim` elements of `output`.
+unsafe fn evaluate_uniform_into<V: Vector>(
+    curve: &PiecewiseCubicCurve<V>,
+    n: usize,
+    output: *mut f32,
+    dim: usize,
+) {
+    // NB: Vec2 and Vec3 are #[repr(C)] and consist of `dim` `f32` values
+    assert_eq!(std::mem::size_of::<V>(), dim * std::mem::size_of::<f32>());
+    let count = curve.segments().len() * n + 1;
+    curve.evaluate_uniform_into(n, slice::from_raw_parts_mut(output as *mut V, count));
+}
+
+/// Returns the grid `0, 1, 2, ...` with `count` elements.
+fn uniform_grid(count: usize) -> Vec<f32> {
+    (0..count).map(|i| i as f32).collect()
+}
+
+/// Converts `values` to half precision, storing the bits in `output`.
+fn write_f16(values: &[f32], output: &mut [u16]) {
+    for (out, &value) in output.iter_mut().zip(values) {
+        *out = f16::from_f32(value).to_bits();
+    }
+}
+
 /// Creates an `AsdfPosSpline3`.
 ///
 /// Each element in `positions` (3D coordinates) and `tcb`
@@ -93,6 +224,59 @@ pub unsafe extern "C" fn asdf_asdfposspline3(
     AsdfPosSpline3::new(&positions, &times, &speeds, tcb, closed).into_box()
 }
 
+/// Creates an `AsdfPosSpline3` from per-vertex data.
+///
+/// Each element in `positions` (3D coordinates) and `tcb`
+/// (tension, continuity, bias) contains *three* `float` values,
+/// `times` and `speeds` contain one `float` per element.
+/// There are `count` vertices, `times` contains one more element
+/// if `closed` is `true`.
+///
+/// Unless the curve is closed, the first and the last vertex
+/// are not allowed to have non-zero TCB values.
+///
+/// # Safety
+///
+/// All input pointers must be valid for the given numbers
+/// of elements (not bytes).
+#[no_mangle]
+pub unsafe extern "C" fn asdf_asdfposspline3_from_vertices(
+    positions: *const f32,
+    times: *const f32,
+    speeds: *const f32,
+    tcb: *const f32,
+    count: size_t,
+    closed: bool,
+) -> Option<Box<AsdfPosSpline3>> {
+    let tcb = slice::from_raw_parts(tcb as *const [f32; 3], count);
+    let inner_tcb = if closed || count < 2 {
+        tcb
+    } else {
+        if tcb[0].iter().any(|&x| x != 0.0) {
+            set_error(
+                "first vertex cannot have tension/continuity/bias (except for closed curves)",
+            );
+            return None;
+        }
+        if tcb[count - 1].iter().any(|&x| x != 0.0) {
+            set_error("last vertex cannot have tension/continuity/bias (except for closed curves)");
+            return None;
+        }
+        &tcb[1..count - 1]
+    };
+    asdf_asdfposspline3(
+        positions,
+        count,
+        times,
+        count + closed as usize,
+        speeds,
+        count,
+        inner_tcb.as_ptr() as *const f32,
+        inner_tcb.len(),
+        closed,
+    )
+}
+
 /// Frees an `AsdfPosSpline3`
 ///
 /// # Safety
@@ -112,30 +296,176 @@ pub unsafe extern "C" fn asdf_asdfposspline3_free(_: Option<Box<AsdfPosSpline3>>
 /// `output` must provide space for *three* `float`s per element.
 #[no_mangle]
 pub unsafe extern "C" fn asdf_asdfposspline3_evaluate(
-    curve: &mut AsdfPosSpline3,
+    curve: &AsdfPosSpline3,
     times: *const f32,
     count: size_t,
     output: *mut f32,
 ) {
-    for i in 0..count {
-        let v = curve.evaluate(*times.add(i));
-        copy_nonoverlapping(v.as_ptr(), output.add(3 * i), 3);
-    }
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        3,
+        false,
+        |v: Vec3, out: &mut [f32]| out.copy_from_slice(v.as_slice()),
+    );
 }
 
-/// Provides a pointer to (and number of) grid elements.
+/// Returns curve value(s) at given time(s).
+///
+/// Large inputs are split into chunks which are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must use `asdf_asdfposspline3_evaluate()` instead.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *three* `float`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_asdfposspline3_evaluate_parallel(
+    curve: &AsdfPosSpline3,
+    times: *const f32,
+    count: size_t,
+    output: *mut f32,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        3,
+        true,
+        |v: Vec3, out: &mut [f32]| out.copy_from_slice(v.as_slice()),
+    );
+}
+
+/// Returns curve value(s) at given time(s) as half-precision floats.
+///
+/// The output values are IEEE 754 binary16 numbers, stored as `uint16_t`.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *three* `uint16_t`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_asdfposspline3_evaluate_f16(
+    curve: &AsdfPosSpline3,
+    times: *const f32,
+    count: size_t,
+    output: *mut u16,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        3,
+        false,
+        |v: Vec3, out: &mut [u16]| write_f16(v.as_slice(), out),
+    );
+}
+
+/// Returns curve value(s) at given time(s) as half-precision floats.
+///
+/// The output values are IEEE 754 binary16 numbers, stored as `uint16_t`.
+///
+/// Large inputs are split into chunks which are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must use `asdf_asdfposspline3_evaluate_f16()` instead.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *three* `uint16_t`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_asdfposspline3_evaluate_f16_parallel(
+    curve: &AsdfPosSpline3,
+    times: *const f32,
+    count: size_t,
+    output: *mut u16,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        3,
+        true,
+        |v: Vec3, out: &mut [u16]| write_f16(v.as_slice(), out),
+    );
+}
+
+/// Returns the values of multiple curves at the same time(s).
+///
+/// If `parallel` is `true`, the curves are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must pass `false` instead.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `curves` contains `curve_count` pointers, `times` contains `count` `float`s,
+/// `output` must provide space for `curve_count * count` elements
+/// of *three* `float`s each (all values of the first curve come first).
+#[no_mangle]
+pub unsafe extern "C" fn asdf_asdfposspline3_evaluate_batch(
+    curves: *const &AsdfPosSpline3,
+    curve_count: size_t,
+    times: *const f32,
+    count: size_t,
+    output: *mut f32,
+    parallel: bool,
+) {
+    evaluate_batch_into(
+        curves,
+        curve_count,
+        times,
+        count,
+        output,
+        3,
+        parallel,
+        |v: Vec3, out: &mut [f32]| out.copy_from_slice(v.as_slice()),
+    );
+}
+
+/// Returns the curve values at all grid elements.
 ///
 /// # Safety
 ///
 /// All pointers must be valid.
+/// `output` must provide space for *three* `float`s per grid element.
 #[no_mangle]
-pub unsafe extern "C" fn asdf_asdfposspline3_grid(
-    curve: &mut AsdfPosSpline3,
-    output: *mut *const f32,
-) -> size_t {
+pub unsafe extern "C" fn asdf_asdfposspline3_evaluate_grid(
+    curve: &AsdfPosSpline3,
+    output: *mut f32,
+) {
     let grid = curve.grid();
-    output.write(grid.as_ptr());
-    grid.len()
+    evaluate_into(
+        curve,
+        grid.as_ptr(),
+        grid.len(),
+        output,
+        3,
+        false,
+        |v: Vec3, out: &mut [f32]| out.copy_from_slice(v.as_slice()),
+    );
+}
+
+/// Provides a pointer to (and number of) grid elements.
+///
+/// # Safety
+///
+/// The pointer must be valid.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_asdfposspline3_grid(curve: &AsdfPosSpline3) -> AsdfGrid {
+    curve.grid().into()
 }
 
 /// Creates a three-dimensional KB-spline.
@@ -165,6 +495,80 @@ pub unsafe extern "C" fn asdf_centripetalkochanekbartelsspline3(
         .into_box()
 }
 
+/// Creates a three-dimensional KB-spline with the same TCB values at all vertices.
+///
+/// Each element in `positions` (3D coordinates) contains *three* `float` values.
+///
+/// # Safety
+///
+/// `positions` must be valid for `positions_count` elements (not bytes).
+#[no_mangle]
+pub unsafe extern "C" fn asdf_centripetalkochanekbartelsspline3_uniform_tcb(
+    positions: *const f32,
+    positions_count: size_t,
+    tension: f32,
+    continuity: f32,
+    bias: f32,
+    closed: bool,
+) -> Option<Box<AsdfCubicCurve3>> {
+    let tcb_count = if closed {
+        positions_count
+    } else {
+        positions_count.saturating_sub(2)
+    };
+    let tcb = vec![[tension, continuity, bias]; tcb_count];
+    asdf_centripetalkochanekbartelsspline3(
+        positions,
+        positions_count,
+        tcb.as_ptr() as *const f32,
+        tcb_count,
+        closed,
+    )
+}
+
+/// Creates a three-dimensional KB-spline from separate coordinate arrays.
+///
+/// `x`, `y` and `z` contain one `float` per position,
+/// `tension`, `continuity` and `bias` contain one `float` per TCB element.
+///
+/// # Safety
+///
+/// All input pointers must be valid for the corresponding `*_count` numbers
+/// of elements (not bytes).
+#[no_mangle]
+pub unsafe extern "C" fn asdf_centripetalkochanekbartelsspline3_soa(
+    x: *const f32,
+    y: *const f32,
+    z: *const f32,
+    positions_count: size_t,
+    tension: *const f32,
+    continuity: *const f32,
+    bias: *const f32,
+    tcb_count: size_t,
+    closed: bool,
+) -> Option<Box<AsdfCubicCurve3>> {
+    let x = slice::from_raw_parts(x, positions_count);
+    let y = slice::from_raw_parts(y, positions_count);
+    let z = slice::from_raw_parts(z, positions_count);
+    let positions: Vec<_> = x
+        .iter()
+        .zip(y)
+        .zip(z)
+        .map(|((&x, &y), &z)| Vec3::new(x, y, z))
+        .collect();
+    let tension = slice::from_raw_parts(tension, tcb_count);
+    let continuity = slice::from_raw_parts(continuity, tcb_count);
+    let bias = slice::from_raw_parts(bias, tcb_count);
+    let tcb: Vec<_> = tension
+        .iter()
+        .zip(continuity)
+        .zip(bias)
+        .map(|((&t, &c), &b)| [t, c, b])
+        .collect();
+    PiecewiseCubicCurve::new_centripetal_kochanek_bartels(&positions, &tcb, closed, Vec3::norm)
+        .into_box()
+}
+
 /// Creates a two-dimensional KB-spline.
 ///
 /// Each element in `positions` (2D coordinates) contains *two* `float` values,
@@ -192,6 +596,37 @@ pub unsafe extern "C" fn asdf_centripetalkochanekbartelsspline2(
         .into_box()
 }
 
+/// Creates a two-dimensional KB-spline with the same TCB values at all vertices.
+///
+/// Each element in `positions` (2D coordinates) contains *two* `float` values.
+///
+/// # Safety
+///
+/// `positions` must be valid for `positions_count` elements (not bytes).
+#[no_mangle]
+pub unsafe extern "C" fn asdf_centripetalkochanekbartelsspline2_uniform_tcb(
+    positions: *const f32,
+    positions_count: size_t,
+    tension: f32,
+    continuity: f32,
+    bias: f32,
+    closed: bool,
+) -> Option<Box<AsdfCubicCurve2>> {
+    let tcb_count = if closed {
+        positions_count
+    } else {
+        positions_count.saturating_sub(2)
+    };
+    let tcb = vec![[tension, continuity, bias]; tcb_count];
+    asdf_centripetalkochanekbartelsspline2(
+        positions,
+        positions_count,
+        tcb.as_ptr() as *const f32,
+        tcb_count,
+        closed,
+    )
+}
+
 /// Creates a one-dimensional shape-preserving cubic spline.
 ///
 /// # Safety
@@ -211,6 +646,22 @@ pub unsafe extern "C" fn asdf_shapepreservingcubicspline(
     PiecewiseCubicCurve::new_shape_preserving(values, grid, closed).into_box()
 }
 
+/// Creates a one-dimensional shape-preserving cubic spline with a grid of `0, 1, 2, ...`.
+///
+/// # Safety
+///
+/// `values` must be valid for `values_count` elements (not bytes).
+#[no_mangle]
+pub unsafe extern "C" fn asdf_shapepreservingcubicspline_uniform(
+    values: *const f32,
+    values_count: size_t,
+    closed: bool,
+) -> Option<Box<AsdfCubicCurve1>> {
+    let values = slice::from_raw_parts(values, values_count);
+    let grid = uniform_grid(values_count + closed as usize);
+    PiecewiseCubicCurve::new_shape_preserving(values, grid, closed).into_box()
+}
+
 /// Creates a one-dimensional shape-preserving cubic spline (given values and slopes).
 ///
 /// # Safety
@@ -255,6 +706,21 @@ pub unsafe extern "C" fn asdf_monotonecubic(
     MonotoneCubicSpline::new(values, grid).into_box()
 }
 
+/// Creates a one-dimensional monotone cubic spline with a grid of `0, 1, 2, ...`.
+///
+/// # Safety
+///
+/// `values` must be valid for `values_count` elements (not bytes).
+#[no_mangle]
+pub unsafe extern "C" fn asdf_monotonecubic_uniform(
+    values: *const f32,
+    values_count: size_t,
+) -> Option<Box<AsdfMonotoneCubic>> {
+    let values = slice::from_raw_parts(values, values_count);
+    let grid = uniform_grid(values_count);
+    MonotoneCubicSpline::new(values, grid).into_box()
+}
+
 /// Creates a one-dimensional monotone cubic spline (given values and slopes).
 ///
 /// # Safety
@@ -297,7 +763,7 @@ pub unsafe extern "C" fn asdf_monotonecubic_free(_: Option<Box<AsdfMonotoneCubic
 /// The pointer must be valid.
 #[no_mangle]
 pub unsafe extern "C" fn asdf_monotonecubic_inner(
-    curve: &mut AsdfMonotoneCubic,
+    curve: &AsdfMonotoneCubic,
 ) -> *const AsdfCubicCurve1 {
     curve.inner_ref()
 }
@@ -311,7 +777,7 @@ pub unsafe extern "C" fn asdf_monotonecubic_inner(
 /// `output` must provide space for one `float` per element.
 #[no_mangle]
 pub unsafe extern "C" fn asdf_monotonecubic_get_time(
-    curve: &mut AsdfMonotoneCubic,
+    curve: &AsdfMonotoneCubic,
     values: *const f32,
     count: size_t,
     output: *mut f32,
@@ -323,6 +789,22 @@ pub unsafe extern "C" fn asdf_monotonecubic_get_time(
     }
 }
 
+/// Returns the time instance for a single given value.
+///
+/// If the solution is not unique, NaN is returned.
+/// If the value is out of range, the first/last time is returned.
+///
+/// # Safety
+///
+/// The pointer must be valid.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_monotonecubic_get_time_scalar(
+    curve: &AsdfMonotoneCubic,
+    value: f32,
+) -> f32 {
+    curve.get_time(value).unwrap_or(f32::NAN)
+}
+
 // TODO: avoid duplication for 1, 2 and 3 dimensions ...
 
 /// Frees an `AsdfCubicCurve3`
@@ -344,30 +826,185 @@ pub unsafe extern "C" fn asdf_cubiccurve3_free(_: Option<Box<AsdfCubicCurve3>>)
 /// `output` must provide space for *three* `float`s per element.
 #[no_mangle]
 pub unsafe extern "C" fn asdf_cubiccurve3_evaluate(
-    curve: &mut AsdfCubicCurve3,
+    curve: &AsdfCubicCurve3,
     times: *const f32,
     count: size_t,
     output: *mut f32,
 ) {
-    for i in 0..count {
-        let v = curve.evaluate(*times.add(i));
-        copy_nonoverlapping(v.as_ptr(), output.add(3 * i), 3);
-    }
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        3,
+        false,
+        |v: Vec3, out: &mut [f32]| out.copy_from_slice(v.as_slice()),
+    );
 }
 
-/// Provides a pointer to (and number of) grid elements.
+/// Returns curve value(s) at given time(s).
+///
+/// Large inputs are split into chunks which are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must use `asdf_cubiccurve3_evaluate()` instead.
 ///
 /// # Safety
 ///
 /// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *three* `float`s per element.
 #[no_mangle]
-pub unsafe extern "C" fn asdf_cubiccurve3_grid(
-    curve: &mut AsdfCubicCurve3,
-    output: *mut *const f32,
-) -> size_t {
-    let grid = curve.grid();
-    output.write(grid.as_ptr());
-    grid.len()
+pub unsafe extern "C" fn asdf_cubiccurve3_evaluate_parallel(
+    curve: &AsdfCubicCurve3,
+    times: *const f32,
+    count: size_t,
+    output: *mut f32,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        3,
+        true,
+        |v: Vec3, out: &mut [f32]| out.copy_from_slice(v.as_slice()),
+    );
+}
+
+/// Returns curve value(s) at given time(s) as half-precision floats.
+///
+/// The output values are IEEE 754 binary16 numbers, stored as `uint16_t`.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *three* `uint16_t`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve3_evaluate_f16(
+    curve: &AsdfCubicCurve3,
+    times: *const f32,
+    count: size_t,
+    output: *mut u16,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        3,
+        false,
+        |v: Vec3, out: &mut [u16]| write_f16(v.as_slice(), out),
+    );
+}
+
+/// Returns curve value(s) at given time(s) as half-precision floats.
+///
+/// The output values are IEEE 754 binary16 numbers, stored as `uint16_t`.
+///
+/// Large inputs are split into chunks which are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must use `asdf_cubiccurve3_evaluate_f16()` instead.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *three* `uint16_t`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve3_evaluate_f16_parallel(
+    curve: &AsdfCubicCurve3,
+    times: *const f32,
+    count: size_t,
+    output: *mut u16,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        3,
+        true,
+        |v: Vec3, out: &mut [u16]| write_f16(v.as_slice(), out),
+    );
+}
+
+/// Returns the values of multiple curves at the same time(s).
+///
+/// If `parallel` is `true`, the curves are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must pass `false` instead.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `curves` contains `curve_count` pointers, `times` contains `count` `float`s,
+/// `output` must provide space for `curve_count * count` elements
+/// of *three* `float`s each (all values of the first curve come first).
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve3_evaluate_batch(
+    curves: *const &AsdfCubicCurve3,
+    curve_count: size_t,
+    times: *const f32,
+    count: size_t,
+    output: *mut f32,
+    parallel: bool,
+) {
+    evaluate_batch_into(
+        curves,
+        curve_count,
+        times,
+        count,
+        output,
+        3,
+        parallel,
+        |v: Vec3, out: &mut [f32]| out.copy_from_slice(v.as_slice()),
+    );
+}
+
+/// Evaluates `n` equally spaced points per segment, followed by the end point.
+///
+/// The number of output elements is `n` times the number of segments plus one.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `n` must be positive.
+/// `output` must provide space for *three* `float`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve3_evaluate_uniform(
+    curve: &AsdfCubicCurve3,
+    n: size_t,
+    output: *mut f32,
+) {
+    evaluate_uniform_into(curve, n, output, 3);
+}
+
+/// Returns the curve values at all grid elements.
+///
+/// The values are taken directly from the polynomial coefficients,
+/// without searching for the segment of each grid element.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `output` must provide space for *three* `float`s per grid element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve3_evaluate_grid(curve: &AsdfCubicCurve3, output: *mut f32) {
+    evaluate_uniform_into(curve, 1, output, 3);
+}
+
+/// Provides a pointer to (and number of) grid elements.
+///
+/// # Safety
+///
+/// The pointer must be valid.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve3_grid(curve: &AsdfCubicCurve3) -> AsdfGrid {
+    curve.grid().into()
 }
 
 /// Frees an `AsdfCubicCurve2`
@@ -388,30 +1025,185 @@ pub unsafe extern "C" fn asdf_cubiccurve2_free(_: Option<Box<AsdfCubicCurve2>>)
 /// `output` must provide space for *two* `float`s per element.
 #[no_mangle]
 pub unsafe extern "C" fn asdf_cubiccurve2_evaluate(
-    curve: &mut AsdfCubicCurve2,
+    curve: &AsdfCubicCurve2,
     times: *const f32,
     count: size_t,
     output: *mut f32,
 ) {
-    for i in 0..count {
-        let v = curve.evaluate(*times.add(i));
-        copy_nonoverlapping(v.as_ptr(), output.add(2 * i), 2);
-    }
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        2,
+        false,
+        |v: Vec2, out: &mut [f32]| out.copy_from_slice(v.as_slice()),
+    );
 }
 
-/// Provides a pointer to (and number of) grid elements.
+/// Returns curve value(s) at given time(s).
+///
+/// Large inputs are split into chunks which are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must use `asdf_cubiccurve2_evaluate()` instead.
 ///
 /// # Safety
 ///
 /// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *two* `float`s per element.
 #[no_mangle]
-pub unsafe extern "C" fn asdf_cubiccurve2_grid(
-    curve: &mut AsdfCubicCurve2,
-    output: *mut *const f32,
-) -> size_t {
-    let grid = curve.grid();
-    output.write(grid.as_ptr());
-    grid.len()
+pub unsafe extern "C" fn asdf_cubiccurve2_evaluate_parallel(
+    curve: &AsdfCubicCurve2,
+    times: *const f32,
+    count: size_t,
+    output: *mut f32,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        2,
+        true,
+        |v: Vec2, out: &mut [f32]| out.copy_from_slice(v.as_slice()),
+    );
+}
+
+/// Returns curve value(s) at given time(s) as half-precision floats.
+///
+/// The output values are IEEE 754 binary16 numbers, stored as `uint16_t`.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *two* `uint16_t`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve2_evaluate_f16(
+    curve: &AsdfCubicCurve2,
+    times: *const f32,
+    count: size_t,
+    output: *mut u16,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        2,
+        false,
+        |v: Vec2, out: &mut [u16]| write_f16(v.as_slice(), out),
+    );
+}
+
+/// Returns curve value(s) at given time(s) as half-precision floats.
+///
+/// The output values are IEEE 754 binary16 numbers, stored as `uint16_t`.
+///
+/// Large inputs are split into chunks which are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must use `asdf_cubiccurve2_evaluate_f16()` instead.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *two* `uint16_t`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve2_evaluate_f16_parallel(
+    curve: &AsdfCubicCurve2,
+    times: *const f32,
+    count: size_t,
+    output: *mut u16,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        2,
+        true,
+        |v: Vec2, out: &mut [u16]| write_f16(v.as_slice(), out),
+    );
+}
+
+/// Returns the values of multiple curves at the same time(s).
+///
+/// If `parallel` is `true`, the curves are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must pass `false` instead.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `curves` contains `curve_count` pointers, `times` contains `count` `float`s,
+/// `output` must provide space for `curve_count * count` elements
+/// of *two* `float`s each (all values of the first curve come first).
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve2_evaluate_batch(
+    curves: *const &AsdfCubicCurve2,
+    curve_count: size_t,
+    times: *const f32,
+    count: size_t,
+    output: *mut f32,
+    parallel: bool,
+) {
+    evaluate_batch_into(
+        curves,
+        curve_count,
+        times,
+        count,
+        output,
+        2,
+        parallel,
+        |v: Vec2, out: &mut [f32]| out.copy_from_slice(v.as_slice()),
+    );
+}
+
+/// Evaluates `n` equally spaced points per segment, followed by the end point.
+///
+/// The number of output elements is `n` times the number of segments plus one.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `n` must be positive.
+/// `output` must provide space for *two* `float`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve2_evaluate_uniform(
+    curve: &AsdfCubicCurve2,
+    n: size_t,
+    output: *mut f32,
+) {
+    evaluate_uniform_into(curve, n, output, 2);
+}
+
+/// Returns the curve values at all grid elements.
+///
+/// The values are taken directly from the polynomial coefficients,
+/// without searching for the segment of each grid element.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `output` must provide space for *two* `float`s per grid element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve2_evaluate_grid(curve: &AsdfCubicCurve2, output: *mut f32) {
+    evaluate_uniform_into(curve, 1, output, 2);
+}
+
+/// Provides a pointer to (and number of) grid elements.
+///
+/// # Safety
+///
+/// The pointer must be valid.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve2_grid(curve: &AsdfCubicCurve2) -> AsdfGrid {
+    curve.grid().into()
 }
 
 /// Frees an `AsdfCubicCurve1`
@@ -434,27 +1226,183 @@ pub unsafe extern "C" fn asdf_cubiccurve1_free(_: Option<Box<AsdfCubicCurve1>>)
 /// `output` must provide space for *one* `float` per element.
 #[no_mangle]
 pub unsafe extern "C" fn asdf_cubiccurve1_evaluate(
-    curve: &mut AsdfCubicCurve1,
+    curve: &AsdfCubicCurve1,
     times: *const f32,
     count: size_t,
     output: *mut f32,
 ) {
-    for i in 0..count {
-        output.add(i).write(curve.evaluate(*times.add(i)));
-    }
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        1,
+        false,
+        |v: f32, out: &mut [f32]| out[0] = v,
+    );
 }
 
-/// Provides a pointer to (and number of) grid elements.
+/// Returns curve value(s) at given time(s).
+///
+/// Large inputs are split into chunks which are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must use `asdf_cubiccurve1_evaluate()` instead.
 ///
 /// # Safety
 ///
 /// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *one* `float` per element.
 #[no_mangle]
-pub unsafe extern "C" fn asdf_cubiccurve1_grid(
-    curve: &mut AsdfCubicCurve1,
-    output: *mut *const f32,
-) -> size_t {
-    let grid = curve.grid();
-    output.write(grid.as_ptr());
-    grid.len()
+pub unsafe extern "C" fn asdf_cubiccurve1_evaluate_parallel(
+    curve: &AsdfCubicCurve1,
+    times: *const f32,
+    count: size_t,
+    output: *mut f32,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        1,
+        true,
+        |v: f32, out: &mut [f32]| out[0] = v,
+    );
+}
+
+/// Returns curve value(s) at given time(s) as half-precision floats.
+///
+/// The output values are IEEE 754 binary16 numbers, stored as `uint16_t`.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *one* `uint16_t`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve1_evaluate_f16(
+    curve: &AsdfCubicCurve1,
+    times: *const f32,
+    count: size_t,
+    output: *mut u16,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        1,
+        false,
+        |v: f32, out: &mut [u16]| write_f16(&[v], out),
+    );
+}
+
+/// Returns curve value(s) at given time(s) as half-precision floats.
+///
+/// The output values are IEEE 754 binary16 numbers, stored as `uint16_t`.
+///
+/// Large inputs are split into chunks which are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must use `asdf_cubiccurve1_evaluate_f16()` instead.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `times` contains one `float` per element,
+/// `output` must provide space for *one* `uint16_t`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve1_evaluate_f16_parallel(
+    curve: &AsdfCubicCurve1,
+    times: *const f32,
+    count: size_t,
+    output: *mut u16,
+) {
+    evaluate_into(
+        curve,
+        times,
+        count,
+        output,
+        1,
+        true,
+        |v: f32, out: &mut [u16]| write_f16(&[v], out),
+    );
+}
+
+/// Returns the values of multiple curves at the same time(s).
+///
+/// If `parallel` is `true`, the curves are evaluated in parallel
+/// on a global thread pool.
+/// The thread pool doesn't survive `fork()`,
+/// forked child processes must pass `false` instead.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `curves` contains `curve_count` pointers, `times` contains `count` `float`s,
+/// `output` must provide space for `curve_count * count` elements
+/// of *one* `float`s each (all values of the first curve come first).
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve1_evaluate_batch(
+    curves: *const &AsdfCubicCurve1,
+    curve_count: size_t,
+    times: *const f32,
+    count: size_t,
+    output: *mut f32,
+    parallel: bool,
+) {
+    evaluate_batch_into(
+        curves,
+        curve_count,
+        times,
+        count,
+        output,
+        1,
+        parallel,
+        |v: f32, out: &mut [f32]| out[0] = v,
+    );
+}
+
+/// Evaluates `n` equally spaced points per segment, followed by the end point.
+///
+/// The number of output elements is `n` times the number of segments plus one.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `n` must be positive.
+/// `output` must provide space for *one* `float`s per element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve1_evaluate_uniform(
+    curve: &AsdfCubicCurve1,
+    n: size_t,
+    output: *mut f32,
+) {
+    evaluate_uniform_into(curve, n, output, 1);
+}
+
+/// Returns the curve values at all grid elements.
+///
+/// The values are taken directly from the polynomial coefficients,
+/// without searching for the segment of each grid element.
+///
+/// # Safety
+///
+/// All pointers must be valid.
+/// `output` must provide space for *one* `float`s per grid element.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve1_evaluate_grid(curve: &AsdfCubicCurve1, output: *mut f32) {
+    evaluate_uniform_into(curve, 1, output, 1);
+}
+
+/// Provides a pointer to (and number of) grid elements.
+///
+/// # Safety
+///
+/// The pointer must be valid.
+#[no_mangle]
+pub unsafe extern "C" fn asdf_cubiccurve1_grid(curve: &AsdfCubicCurve1) -> AsdfGrid {
+    curve.grid().into()
 }
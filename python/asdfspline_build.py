@@ -1,15 +1,39 @@
+from pathlib import Path
 from subprocess import run
 
 from cffi import FFI
 
-run(
-    ['cargo', 'build', '--all', '--release'],
-    cwd='..',
-    check=True,
-)
+SOURCES = [
+    *Path('..').glob('src/**/*.rs'),
+    *Path('..').glob('ffi/src/**/*.rs'),
+    Path('../Cargo.toml'),
+    Path('../ffi/Cargo.toml'),
+]
+LIBRARIES = [
+    Path('../target/release/libasdfspline_ffi.a'),
+    Path('../target/release/asdfspline_ffi.lib'),
+]
+
+
+def up_to_date(targets, sources):
+    """Check if any of the targets is newer than all sources."""
+    newest_source = max(source.stat().st_mtime for source in sources)
+    return any(
+        target.exists() and target.stat().st_mtime >= newest_source
+        for target in targets)
+
+
+if not up_to_date(LIBRARIES, SOURCES):
+    run(
+        ['cargo', 'build', '--all', '--release'],
+        cwd='..',
+        check=True,
+    )
 
-run(['cbindgen', '../ffi', '--config', 'cbindgen.toml', '-o', 'asdfspline.h'],
-    check=True)
+if not up_to_date([Path('asdfspline.h')], SOURCES + [Path('cbindgen.toml')]):
+    run(['cbindgen', '../ffi', '--config', 'cbindgen.toml',
+         '-o', 'asdfspline.h'],
+        check=True)
 
 ffibuilder = FFI()
 ffibuilder.cdef(open('asdfspline.h').read())
@@ -17,6 +41,7 @@ ffibuilder.set_source(
     '_asdfspline',
     r"""
     #include <stdbool.h>
+    #include <stdint.h>
     #include "asdfspline.h"
     """,
     include_dirs=['.'],
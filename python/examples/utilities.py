@@ -7,39 +7,59 @@ def plot_1d(s, ax=None):
     """Plot a one-dimensional spline."""
     if ax is None:
         ax = plt.gca()
-    times = np.linspace(s.grid[0], s.grid[-1], 200, endpoint=True)
-    ax.plot(times, s.evaluate(times))
-    ax.scatter(s.grid, s.evaluate(s.grid), marker='x', c='black')
+    grid = s.grid
+    times = np.linspace(grid[0], grid[-1], 200, endpoint=True)
+    values, grid_values = _evaluate_with_grid(s, times, grid)
+    ax.plot(times, values)
+    ax.scatter(grid, grid_values, marker='x', c='black')
 
 
 def plot_2d(s, dots_per_second=10, ax=None):
     """Plot a two-dimensional spline (or a 3D-spline with all zero y-values)."""
-    total_duration = s.grid[-1] - s.grid[0]
-    times = s.grid[0] + np.arange(int(total_duration * dots_per_second) + 1) / dots_per_second
+    grid = s.grid
+    times = _dot_times(grid, dots_per_second)
     if ax is None:
         ax = plt.gca()
-    data = s.evaluate(times)
+    data, grid_data = _evaluate_with_grid(s, times, grid)
     if data.shape[1] == 3:
         if np.any(data[:, 2] != 0):
             raise ValueError('z values must be zero')
         data = data[:, :2]
     ax.plot(*data.T, '.')
-    ax.scatter(*s.evaluate(s.grid)[:, :2].T, marker='x', c='black')
+    ax.scatter(*grid_data[:, :2].T, marker='x', c='black')
     ax.axis('equal')
 
 
 def plot_3d(s, dots_per_second=10, ax=None):
-    total_duration = s.grid[-1] - s.grid[0]
-    times = s.grid[0] + np.arange(int(total_duration * dots_per_second) + 1) / dots_per_second
+    grid = s.grid
+    times = _dot_times(grid, dots_per_second)
     if ax is None:
         ax = plt.gca(projection='3d')
-    ax.plot(*s.evaluate(times).T, '.')
+    data, grid_data = _evaluate_with_grid(s, times, grid)
+    ax.plot(*data.T, '.')
     # https://github.com/matplotlib/matplotlib/issues/18020
-    #ax.scatter(*s.evaluate(s.grid).T, marker='x', c='black')
-    ax.scatter(*s.evaluate(s.grid).T, c='black')
+    #ax.scatter(*grid_data.T, marker='x', c='black')
+    ax.scatter(*grid_data.T, c='black')
     set_3d_axes_equal(ax)
 
 
+def _dot_times(grid, dots_per_second):
+    """Equally spaced times from the first to the last grid value."""
+    start, end = grid[0], grid[-1]
+    count = int((end - start) * dots_per_second) + 1
+    return start + np.arange(count, dtype='float32') / dots_per_second
+
+
+def _evaluate_with_grid(s, times, grid):
+    """Evaluate at given times and at grid points with a single call."""
+    combined = np.concatenate([
+        np.asarray(times, dtype='float32'),
+        np.asarray(grid, dtype='float32'),
+    ])
+    data = s.evaluate(combined)
+    return data[:len(times)], data[len(times):]
+
+
 def set_3d_axes_equal(ax):
     # https://stackoverflow.com/a/50664367/
     limits = np.array([
@@ -10,7 +10,7 @@ setup(
     package_dir={'': 'src'},
     py_modules=['asdfspline'],
     cffi_modules=['asdfspline_build.py:ffibuilder'],
-    setup_requires=["CFFI>=1.0.0"],
-    install_requires=["CFFI>=1.0.0"],
+    setup_requires=["CFFI>=1.12"],
+    install_requires=["CFFI>=1.12"],
     zip_safe=False,
 )
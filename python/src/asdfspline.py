@@ -1,128 +1,442 @@
+import ctypes as _ctypes
+import weakref as _weakref
+
 from _asdfspline import ffi as _ffi, lib as _lib
 import numpy as _np
 
+_F32_SIZE = _np.dtype('float32').itemsize
+_SCALAR = int, float, _np.integer, _np.floating
+
 
 class _FromPtr:
 
     def __init__(self, ptr):
         if ptr == _ffi.NULL:
             raise ValueError(_ffi.string(_lib.asdf_last_error()).decode())
-        self._ptr = ptr
+        # NB: None after close()
+        self._cdata = ptr
+        # NB: The grid is fetched (and copied) on first access
+        self._grid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Free the Rust object now instead of at garbage collection."""
+        ptr, self._cdata = self._cdata, None
+        if ptr is not None:
+            _ffi.release(ptr)
+        self._grid = None
+
+    @property
+    def _ptr(self):
+        if self._cdata is None:
+            raise ValueError('spline is closed')
+        return self._cdata
+
+    @property
+    def _address(self):
+        return int(_ffi.cast('uintptr_t', self._ptr))
+
+    def _raw_evaluate(self, t_ptr, n, out_ptr):
+        """Evaluate with raw pointers (e.g. from ctypes or Numba)."""
+        self._evaluate_fn(self._address, t_ptr, n, out_ptr)
+
+
+# NB: These are plain ctypes function objects, which can be called from
+#     Numba's nopython mode (with self._address as first argument).
+_EVALUATE_FUNCTYPE = _ctypes.CFUNCTYPE(
+    None,
+    _ctypes.c_void_p,
+    _ctypes.POINTER(_ctypes.c_float),
+    _ctypes.c_size_t,
+    _ctypes.POINTER(_ctypes.c_float),
+)
+
+
+def _ctypes_evaluate_fn(name):
+    address = _ffi.cast('uintptr_t', _ffi.addressof(_lib, name))
+    return _EVALUATE_FUNCTYPE(int(address))
+
+
+_evaluate_fn_asdfposspline3 = _ctypes_evaluate_fn(
+    'asdf_asdfposspline3_evaluate')
+_evaluate_fn_3d = _ctypes_evaluate_fn('asdf_cubiccurve3_evaluate')
+_evaluate_fn_2d = _ctypes_evaluate_fn('asdf_cubiccurve2_evaluate')
+_evaluate_fn_1d = _ctypes_evaluate_fn('asdf_cubiccurve1_evaluate')
 
 
 class AsdfSpline(_FromPtr):
 
+    _evaluate_fn = _evaluate_fn_asdfposspline3
+
     def __init__(self, data):
-        positions = []
-        times = []
-        speeds = []
-        tcb = []
+        if isinstance(data, dict):
+            invalid = data.keys() - {
+                'positions', 'times', 'speeds', 'tcb', 'closed'}
+            if invalid:
+                raise ValueError('invalid key(s): {}'.format(invalid))
+            if 'positions' not in data:
+                raise ValueError('positions must be given')
+            self._init_from_arrays(**data)
+        elif isinstance(data, _np.ndarray) and data.dtype.names is not None:
+            self._init_from_fields(data)
+        else:
+            self._init_from_vertices(data)
+
+    @classmethod
+    def from_arrays(
+            cls, positions, times=None, speeds=None, tcb=None, closed=False):
+        """Create a spline from arrays instead of a list of vertices.
+
+        For open curves, tcb only contains values for the inner vertices
+        (i.e. two fewer than positions), for closed curves one per vertex.
+
+        """
+        return cls(dict(
+            positions=positions, times=times, speeds=speeds, tcb=tcb,
+            closed=closed))
+
+    def _init_from_arrays(
+            self, positions, times=None, speeds=None, tcb=None, closed=False):
+        positions, positions_ptr = _make_positions_buffer(positions)
+        N = len(positions)
+        times, times_ptr = _make_times_buffer(times, N, closed)
+        speeds, speeds_ptr = _make_speeds_buffer(speeds, N)
+        tcb, tcb_ptr = _make_buffer(3, _check_tcb(tcb, closed, N))
+        ptr = _ffi.gc(
+            _lib.asdf_asdfposspline3(
+                positions_ptr, len(positions),
+                times_ptr, len(times),
+                speeds_ptr, len(speeds),
+                tcb_ptr, len(tcb),
+                closed,
+                ),
+            _lib.asdf_asdfposspline3_free)
+        super().__init__(ptr)
+
+    def _init_from_fields(self, data):
+        names = set(data.dtype.names)
+        if 'position' not in names:
+            raise ValueError('every vertex must have a position')
+        invalid = names - {
+            'position', 'time', 'speed', 'tension', 'continuity', 'bias'}
+        if invalid:
+            raise ValueError('invalid key(s): {}'.format(invalid))
+        positions, positions_ptr = _make_positions_buffer(data['position'])
+        N = len(positions)
+        times, times_ptr = _make_times_buffer(
+            data['time'] if 'time' in names else None, N, False)
+        speeds, speeds_ptr = _make_speeds_buffer(
+            data['speed'] if 'speed' in names else None, N)
+        tcb = _np.zeros((N, 3), dtype='float32')
+        for i, name in enumerate(['tension', 'continuity', 'bias']):
+            if name in names:
+                tcb[:, i] = data[name]
+        ptr = _ffi.gc(
+            _lib.asdf_asdfposspline3_from_vertices(
+                positions_ptr,
+                times_ptr,
+                speeds_ptr,
+                _ffi.from_buffer('float[]', tcb),
+                N,
+                False,
+                ),
+            _lib.asdf_asdfposspline3_free)
+        super().__init__(ptr)
+
+    def _init_from_vertices(self, data):
+        data = list(data)
+        size = len(data)
+        # NB: All numbers are stored in a single buffer, the parts are
+        #     passed to Rust via offsets (the closing vertex only has a time)
+        buffer = _np.empty(8 * size, dtype='float32')
+        positions = buffer[:3 * size].reshape(size, 3)
+        times = buffer[3 * size:4 * size]
+        speeds = buffer[4 * size:5 * size]
+        tcb = buffer[5 * size:].reshape(size, 3)
+        N = size
         closed = False
-        for vertex in data:
+        for i, vertex in enumerate(data):
             vertex = dict(vertex)  # Make a copy
             position = vertex.pop('position', None)
             if position is None:
                 raise ValueError('every vertex must have a position')
             time = vertex.pop('time', _np.nan)
-            if not _np.isscalar(time):
+            if not isinstance(time, _SCALAR):
                 raise TypeError('time values must be scalars')
-            times.append(time)
-            if position == 'closed':
+            times[i] = time
+            if isinstance(position, str):
+                if position != 'closed':
+                    raise ValueError(
+                        'the only allowed string position is "closed"')
                 if vertex:
                     raise ValueError(
                         'when position is "closed", only time is allowed')
                 closed = True
+                N = i
                 break
             position = _np.asarray(position, dtype='float32')
             if position.ndim != 1:
                 raise ValueError('positions must be one-dimensional')
-            if len(position) == 2:
-                position = _np.append(position, 0)
-            if len(position) != 3:
+            if len(position) not in (2, 3):
                 raise ValueError('positions must be 2- or 3-dimensional')
-            positions.append(position)
+            positions[i, :len(position)] = position
+            if len(position) == 2:
+                positions[i, 2] = 0
             speed = vertex.pop('speed', _np.nan)
-            if not _np.isscalar(speed):
+            if not isinstance(speed, _SCALAR):
                 raise TypeError('speed values must be scalars')
-            speeds.append(speed)
+            speeds[i] = speed
             tension = vertex.pop('tension', 0)
-            if not _np.isscalar(tension):
+            if not isinstance(tension, _SCALAR):
                 raise TypeError('tension values must be scalars')
             continuity = vertex.pop('continuity', 0)
-            if not _np.isscalar(continuity):
+            if not isinstance(continuity, _SCALAR):
                 raise TypeError('continuity values must be scalars')
             bias = vertex.pop('bias', 0)
-            if not _np.isscalar(bias):
+            if not isinstance(bias, _SCALAR):
                 raise TypeError('bias values must be scalars')
-            tcb.append((tension, continuity, bias))
+            tcb[i] = tension, continuity, bias
             if vertex:
                 raise ValueError('invalid key(s): {}'.format(set(vertex)))
-        if len(positions) < 2:
+        if N < 2:
             raise ValueError('at least two vertices are needed')
-        if not closed:
-            assert len(tcb) >= 2
-            if tcb.pop(0) != (0, 0, 0):
-                raise ValueError(
-                    'first vertex cannot have tension/continuity/bias '
-                    '(except for closed curves')
-            if tcb.pop(-1) != (0, 0, 0):
-                raise ValueError(
-                    'last vertex cannot have tension/continuity/bias '
-                    '(except for closed curves)')
-        positions, positions_ptr = _make_buffer(3, positions)
+        # NB: In case of a closed curve, there is one more time than positions
+        times = times[:N + closed]
         if _np.isnan(times[0]):
-            # NB: NaN <= 0 returns False
-            if any(t <= 0 for t in times):
-                raise ValueError('first time defaults to 0 if other times > 0')
-            times[0] = 0
-        times, times_ptr = _make_buffer(1, times)
-        speeds, speeds_ptr = _make_buffer(1, speeds)
-        tcb = _np.ascontiguousarray(tcb, dtype='float32')
-        tcb_ptr = _ffi.from_buffer('float[]', tcb)
+            _set_default_first_time(times)
+        buffer_ptr = _ffi.from_buffer('float[]', buffer)
+        # NB: The TCB values of the first and last vertex are checked in Rust
         ptr = _ffi.gc(
-            _lib.asdf_asdfposspline3(
-                positions_ptr, len(positions),
-                times_ptr, len(times),
-                speeds_ptr, len(speeds),
-                tcb_ptr, len(tcb),
+            _lib.asdf_asdfposspline3_from_vertices(
+                buffer_ptr,
+                buffer_ptr + 3 * size,
+                buffer_ptr + 4 * size,
+                buffer_ptr + 5 * size,
+                N,
                 closed,
                 ),
             _lib.asdf_asdfposspline3_free)
         super().__init__(ptr)
 
-    def evaluate(self, t):
-        return _evaluate(t, (3,), _lib.asdf_asdfposspline3_evaluate, self._ptr)
+    def evaluate(self, t, out=None, *, chunk=None, dtype=None,
+                 parallel=False):
+        return _evaluate(
+            t, (3,), _lib.asdf_asdfposspline3_evaluate, self._ptr, out, chunk,
+            dtype, parallel)
+
+    def evaluate_grid(self, out=None):
+        """Evaluate the spline at all elements of its grid."""
+        return _evaluate_grid(
+            (3,), _lib.asdf_asdfposspline3_evaluate_grid, self._ptr,
+            len(self.grid), out)
 
     @property
     def grid(self):
-        return _grid(_lib.asdf_asdfposspline3_grid, self._ptr)
-
-
-def _evaluate(t, extra_dim, func, ptr):
-    t = _np.ascontiguousarray(t, dtype='float32')
-    t_ptr = _ffi.from_buffer('float[]', t)
-    output = _np.empty(t.shape + extra_dim, dtype='float32')
-    output_ptr = _ffi.from_buffer('float[]', output)
-    func(ptr, t_ptr, t.size, output_ptr)
-    return output
+        if self._grid is None:
+            self._grid = _fetch_grid(_lib.asdf_asdfposspline3_grid, self._ptr)
+        return self._grid
+
+
+def _make_positions_buffer(positions):
+    positions = _as_f32_contig(positions)
+    if positions.ndim == 2 and positions.shape[1] == 2:
+        # NB: 2D positions are padded with zeros (in one go)
+        positions = _np.concatenate(
+            [positions, _np.zeros((len(positions), 1), dtype='float32')],
+            axis=1)
+    return _make_buffer(3, positions, 'positions')
+
+
+def _make_times_buffer(times, N, closed):
+    if times is None:
+        times = _np.full(N + closed, _np.nan, dtype='float32')
+    times = _check_numbers(1, times, 'times')
+    if len(times) and _np.isnan(times[0]):
+        times = times.copy()
+        _set_default_first_time(times)
+    return times, _ffi.from_buffer('float[]', times)
+
+
+def _make_speeds_buffer(speeds, N):
+    if speeds is None:
+        speeds = _np.full(N, _np.nan, dtype='float32')
+    return _make_buffer(1, speeds, 'speeds')
+
+
+def _set_default_first_time(times):
+    # NB: NaN <= 0 returns False
+    if _np.any(times <= 0):
+        raise ValueError('first time defaults to 0 if other times > 0')
+    times[0] = 0
+
+
+def _as_f32_contig(numbers):
+    # NB: Like ascontiguousarray(), this always returns at least 1D arrays
+    if (isinstance(numbers, _np.ndarray) and numbers.dtype == _np.float32
+            and numbers.ndim and numbers.flags.c_contiguous):
+        return numbers
+    return _np.ascontiguousarray(numbers, dtype='float32')
+
+
+_input_ptr_cache = {}
+
+
+def _input_ptr(array):
+    # NB: Only read-only arrays (like the grid) are cached, because the
+    #     data pointer of other arrays might change (e.g. with resize())
+    if array.flags.writeable:
+        return _ffi.from_buffer('float[]', array)
+    key = id(array)
+    entry = _input_ptr_cache.get(key)
+    if entry is not None and entry[0]() is array:
+        return entry[1]
+
+    def remove(ref):
+        if _input_ptr_cache.get(key, (None,))[0] is ref:
+            del _input_ptr_cache[key]
+
+    # NB: The cast pointer doesn't keep the array alive, the cache entry
+    #     is removed as soon as the array is garbage-collected
+    ptr = _ffi.cast('float *', _ffi.from_buffer('float[]', array))
+    _input_ptr_cache[key] = _weakref.ref(array, remove), ptr
+    return ptr
+
+
+# NB: Functions with half-precision output, by their float32 counterparts
+_EVALUATE_F16 = {
+    _lib.asdf_asdfposspline3_evaluate: _lib.asdf_asdfposspline3_evaluate_f16,
+    _lib.asdf_cubiccurve3_evaluate: _lib.asdf_cubiccurve3_evaluate_f16,
+    _lib.asdf_cubiccurve2_evaluate: _lib.asdf_cubiccurve2_evaluate_f16,
+    _lib.asdf_cubiccurve1_evaluate: _lib.asdf_cubiccurve1_evaluate_f16,
+}
+
+# NB: Multi-threaded functions, by their single-threaded counterparts
+_EVALUATE_PARALLEL = {
+    _lib.asdf_asdfposspline3_evaluate:
+        _lib.asdf_asdfposspline3_evaluate_parallel,
+    _lib.asdf_asdfposspline3_evaluate_f16:
+        _lib.asdf_asdfposspline3_evaluate_f16_parallel,
+    _lib.asdf_cubiccurve3_evaluate:
+        _lib.asdf_cubiccurve3_evaluate_parallel,
+    _lib.asdf_cubiccurve3_evaluate_f16:
+        _lib.asdf_cubiccurve3_evaluate_f16_parallel,
+    _lib.asdf_cubiccurve2_evaluate:
+        _lib.asdf_cubiccurve2_evaluate_parallel,
+    _lib.asdf_cubiccurve2_evaluate_f16:
+        _lib.asdf_cubiccurve2_evaluate_f16_parallel,
+    _lib.asdf_cubiccurve1_evaluate:
+        _lib.asdf_cubiccurve1_evaluate_parallel,
+    _lib.asdf_cubiccurve1_evaluate_f16:
+        _lib.asdf_cubiccurve1_evaluate_f16_parallel,
+}
+
+
+# NB: The keyword-only defaults turn global lookups into local ones
+def _evaluate(t, extra_dim, func, ptr, out, chunk, dtype, parallel, *,
+              _as_f32_contig=_as_f32_contig, _empty=_np.empty,
+              _from_buffer=_ffi.from_buffer, _input_ptr=_input_ptr):
+    if dtype is None or _np.dtype(dtype) == _np.float32:
+        dtype = _np.float32
+        out_cdecl = 'float[]'
+    elif _np.dtype(dtype) == _np.float16:
+        dtype = _np.float16
+        out_cdecl = 'uint16_t[]'
+        func = _EVALUATE_F16[func]
+    else:
+        raise ValueError('dtype must be float32 or float16')
+    if parallel:
+        func = _EVALUATE_PARALLEL[func]
+    if chunk is None:
+        t = _as_f32_contig(t)
+    else:
+        if chunk < 1:
+            raise ValueError('chunk must be a positive integer')
+        # NB: Arrays are converted to float32 one chunk at a time,
+        #     other sequences (e.g. lists) have to be converted at once
+        if not isinstance(t, _np.ndarray):
+            t = _np.asarray(t, dtype=_np.float32)
+        t = _np.atleast_1d(t)
+    if out is None:
+        out = _empty(t.shape + extra_dim, dtype=dtype)
+    else:
+        _check_out(out, t.shape + extra_dim, dtype, source=t)
+    out_ptr = _from_buffer(out_cdecl, out)
+    if chunk is None:
+        func(ptr, _input_ptr(t), t.size, out_ptr)
+        return out
+    # NB: t.flat only copies the requested slice of non-contiguous arrays
+    t_flat = t.reshape(-1) if t.flags.c_contiguous else t.flat
+    dim = int(_np.prod(extra_dim))
+    for start in range(0, t.size, chunk):
+        t_chunk = _as_f32_contig(t_flat[start:start + chunk])
+        func(ptr, _from_buffer('float[]', t_chunk), t_chunk.size,
+             out_ptr + start * dim)
+    return out
+
+
+def _evaluate_uniform(n, extra_dim, func, ptr, segments, out):
+    if n < 1:
+        raise ValueError('n_per_segment must be a positive integer')
+    shape = (segments * n + 1,) + extra_dim
+    if out is None:
+        out = _np.empty(shape, dtype=_np.float32)
+    else:
+        _check_out(out, shape)
+    func(ptr, n, _ffi.from_buffer('float[]', out))
+    return out
 
 
-def _grid(func, ptr):
-    grid_ptr = _ffi.new('float**')
-    grid_len = func(ptr, grid_ptr)
-    if grid_len == 0:
+def _evaluate_grid(extra_dim, func, ptr, size, out):
+    shape = (size,) + extra_dim
+    if out is None:
+        out = _np.empty(shape, dtype=_np.float32)
+    else:
+        _check_out(out, shape)
+    func(ptr, _ffi.from_buffer('float[]', out))
+    return out
+
+
+def _check_out(out, shape, dtype=_np.float32, source=None):
+    if not isinstance(out, _np.ndarray):
+        raise TypeError('out must be a NumPy array')
+    if out.shape != shape:
+        raise ValueError('out must have shape {}'.format(shape))
+    if out.dtype != dtype:
+        raise ValueError('out must have dtype {}'.format(_np.dtype(dtype)))
+    if not out.flags.c_contiguous:
+        raise ValueError('out must be C-contiguous')
+    if not out.flags.writeable:
+        raise ValueError('out must be writeable')
+    # NB: Overlapping input and output would be Undefined Behavior in Rust
+    if source is not None and _np.shares_memory(out, source):
+        raise ValueError('out must not overlap with the input')
+
+
+def _fetch_grid(func, ptr):
+    grid = func(ptr)
+    if grid.len == 0:
         raise RuntimeError(_ffi.string(_lib.asdf_last_error()).decode())
-    buffer = _ffi.buffer(
-        grid_ptr[0], grid_len * _np.dtype('float32').itemsize)
-    array = _np.frombuffer(buffer, dtype='float32')
-    # NB: Writing to this array would be Undefined Behavior
+    buffer = _ffi.buffer(grid.data, grid.len * _F32_SIZE)
+    # NB: The array is copied to stay valid after the Rust object is freed
+    array = _np.frombuffer(buffer, dtype='float32').copy()
     array.flags.writeable = False
     return array
 
 
 def _make_buffer(dim, numbers, name=None):
+    numbers = _check_numbers(dim, numbers, name)
+    numbers_ptr = _ffi.from_buffer('float[]', numbers)
+    return numbers, numbers_ptr
+
+
+def _check_numbers(dim, numbers, name=None):
     # NB: If name is None, this is supposed to never fail
-    numbers = _np.ascontiguousarray(numbers, dtype='float32')
+    numbers = _as_f32_contig(numbers)
     if dim > 1:
         if numbers.ndim != 2:
             raise ValueError(
@@ -135,95 +449,255 @@ def _make_buffer(dim, numbers, name=None):
             raise ValueError(name + ' must be one-dimensional')
     else:
         assert False
-    numbers_ptr = _ffi.from_buffer('float[]', numbers)
-    return numbers, numbers_ptr
+    return numbers
+
+
+def _is_f32_fortran(numbers, dim):
+    return (
+        isinstance(numbers, _np.ndarray)
+        and numbers.dtype == _np.float32
+        and numbers.ndim == 2
+        and numbers.shape[1] == dim
+        and numbers.flags.f_contiguous
+        and not numbers.flags.c_contiguous
+    )
 
 
 def _check_tcb(tcb, closed, N):
+    if not closed:
+        N = max(N - 2, 0)
     if tcb is None:
-        tcb = 0, 0, 0
-    tcb = _np.ascontiguousarray(tcb, dtype='float32')
-    if tcb.ndim == 1:
-        if not closed:
-            N = max(N - 2, 0)
-        tcb = _np.tile(tcb, (N, 1))
+        tcb = _np.zeros((N, 3), dtype='float32')
+    else:
+        tcb = _as_f32_contig(tcb)
+        if tcb.ndim == 1:
+            tcb = _np.tile(tcb, (N, 1))
     if tcb.ndim != 2:
         raise ValueError(
             'TCB values must be two-dimensional (list of triples)')
     if tcb.shape[1] != 3:
         raise ValueError('TCB values must be a list of triples')
-    tcb_ptr = _ffi.from_buffer('float[]', tcb)
-    return tcb, tcb_ptr
+    return tcb
+
+
+def _uniform_tcb(tcb):
+    # NB: Returns the converted TCB values as well, to be passed on to
+    #     _check_tcb() if they are not the same for all vertices (None)
+    if tcb is None:
+        return (0, 0, 0), tcb
+    tcb = _as_f32_contig(tcb)
+    if tcb.shape == (3,):
+        return tuple(tcb.tolist()), tcb
+    return None, tcb
+
+
+def _kochanek_bartels_batch(
+        cls, dim, func, free, positions_list, tcb_list, closed):
+    positions_list = [
+        _check_numbers(dim, positions, 'positions')
+        for positions in positions_list]
+    if tcb_list is None:
+        tcb_list = [None] * len(positions_list)
+    if len(tcb_list) != len(positions_list):
+        raise ValueError(
+            'number of TCB lists must be the same as number of position lists')
+    tcb_list = [
+        _check_tcb(tcb, closed, len(positions))
+        for tcb, positions in zip(tcb_list, positions_list)]
+    if not positions_list:
+        return []
+    # NB: All splines share the same two buffers
+    _, positions_ptr = _make_buffer(dim, _np.concatenate(positions_list))
+    _, tcb_ptr = _make_buffer(3, _np.concatenate(tcb_list))
+    splines = []
+    positions_offset = tcb_offset = 0
+    for positions, tcb in zip(positions_list, tcb_list):
+        ptr = _ffi.gc(
+            func(
+                positions_ptr + positions_offset, len(positions),
+                tcb_ptr + tcb_offset, len(tcb),
+                closed,
+            ),
+            free)
+        spline = cls.__new__(cls)
+        _FromPtr.__init__(spline, ptr)
+        splines.append(spline)
+        positions_offset += positions.size
+        tcb_offset += tcb.size
+    return splines
 
 
 class _CubicCurve3(_FromPtr):
 
-    def evaluate(self, t):
-        return _evaluate(t, (3,), _lib.asdf_cubiccurve3_evaluate, self._ptr)
+    _evaluate_fn = _evaluate_fn_3d
+
+    def evaluate(self, t, out=None, *, chunk=None, dtype=None,
+                 parallel=False):
+        return _evaluate(
+            t, (3,), _lib.asdf_cubiccurve3_evaluate, self._ptr, out, chunk,
+            dtype, parallel)
+
+    def evaluate_uniform(self, n_per_segment, out=None):
+        """Evaluate n_per_segment points per segment, plus the end point."""
+        return _evaluate_uniform(
+            n_per_segment, (3,), _lib.asdf_cubiccurve3_evaluate_uniform,
+            self._ptr, len(self.grid) - 1, out)
+
+    def evaluate_grid(self, out=None):
+        """Evaluate the spline at all elements of its grid."""
+        return _evaluate_grid(
+            (3,), _lib.asdf_cubiccurve3_evaluate_grid, self._ptr,
+            len(self.grid), out)
 
     @property
     def grid(self):
-        return _grid(_lib.asdf_cubiccurve3_grid, self._ptr)
+        if self._grid is None:
+            self._grid = _fetch_grid(_lib.asdf_cubiccurve3_grid, self._ptr)
+        return self._grid
 
 
 class CentripetalKochanekBartelsSpline3(_CubicCurve3):
 
     def __init__(self, positions, *, tcb=None, closed=False):
+        if _is_f32_fortran(positions, 3):
+            # NB: The columns of the array are used without copying
+            x, y, z = positions.T
+            tcb = _np.ascontiguousarray(
+                _check_tcb(tcb, closed, len(positions)).T)
+            t, c, b = tcb
+            ptr = _ffi.gc(
+                _lib.asdf_centripetalkochanekbartelsspline3_soa(
+                    _ffi.from_buffer('float[]', x),
+                    _ffi.from_buffer('float[]', y),
+                    _ffi.from_buffer('float[]', z),
+                    len(positions),
+                    _ffi.from_buffer('float[]', t),
+                    _ffi.from_buffer('float[]', c),
+                    _ffi.from_buffer('float[]', b),
+                    tcb.shape[1],
+                    closed,
+                ),
+                _lib.asdf_cubiccurve3_free)
+            super().__init__(ptr)
+            return
         positions, positions_ptr = _make_buffer(3, positions, 'positions')
-        tcb, tcb_ptr = _check_tcb(tcb, closed, len(positions))
-        ptr = _ffi.gc(
-            _lib.asdf_centripetalkochanekbartelsspline3(
+        uniform_tcb, tcb = _uniform_tcb(tcb)
+        if uniform_tcb is None:
+            tcb, tcb_ptr = _make_buffer(
+                3, _check_tcb(tcb, closed, len(positions)))
+            ptr = _lib.asdf_centripetalkochanekbartelsspline3(
                 positions_ptr, len(positions),
                 tcb_ptr, len(tcb),
                 closed,
-            ),
-            _lib.asdf_cubiccurve3_free)
-        super().__init__(ptr)
+            )
+        else:
+            ptr = _lib.asdf_centripetalkochanekbartelsspline3_uniform_tcb(
+                positions_ptr, len(positions), *uniform_tcb, closed)
+        super().__init__(_ffi.gc(ptr, _lib.asdf_cubiccurve3_free))
+
+    @classmethod
+    def from_batch(cls, positions_list, *, tcb_list=None, closed=False):
+        """Create one spline per list of positions, sharing one buffer."""
+        return _kochanek_bartels_batch(
+            cls, 3, _lib.asdf_centripetalkochanekbartelsspline3,
+            _lib.asdf_cubiccurve3_free, positions_list, tcb_list, closed)
 
 
 class _CubicCurve2(_FromPtr):
 
-    def evaluate(self, t):
-        return _evaluate(t, (2,), _lib.asdf_cubiccurve2_evaluate, self._ptr)
+    _evaluate_fn = _evaluate_fn_2d
+
+    def evaluate(self, t, out=None, *, chunk=None, dtype=None,
+                 parallel=False):
+        return _evaluate(
+            t, (2,), _lib.asdf_cubiccurve2_evaluate, self._ptr, out, chunk,
+            dtype, parallel)
+
+    def evaluate_uniform(self, n_per_segment, out=None):
+        """Evaluate n_per_segment points per segment, plus the end point."""
+        return _evaluate_uniform(
+            n_per_segment, (2,), _lib.asdf_cubiccurve2_evaluate_uniform,
+            self._ptr, len(self.grid) - 1, out)
+
+    def evaluate_grid(self, out=None):
+        """Evaluate the spline at all elements of its grid."""
+        return _evaluate_grid(
+            (2,), _lib.asdf_cubiccurve2_evaluate_grid, self._ptr,
+            len(self.grid), out)
 
     @property
     def grid(self):
-        return _grid(_lib.asdf_cubiccurve2_grid, self._ptr)
+        if self._grid is None:
+            self._grid = _fetch_grid(_lib.asdf_cubiccurve2_grid, self._ptr)
+        return self._grid
 
 
 class CentripetalKochanekBartelsSpline2(_CubicCurve2):
 
     def __init__(self, positions, *, tcb=None, closed=False):
         positions, positions_ptr = _make_buffer(2, positions, 'positions')
-        tcb, tcb_ptr = _check_tcb(tcb, closed, len(positions))
-        ptr = _ffi.gc(
-            _lib.asdf_centripetalkochanekbartelsspline2(
+        uniform_tcb, tcb = _uniform_tcb(tcb)
+        if uniform_tcb is None:
+            tcb, tcb_ptr = _make_buffer(
+                3, _check_tcb(tcb, closed, len(positions)))
+            ptr = _lib.asdf_centripetalkochanekbartelsspline2(
                 positions_ptr, len(positions),
                 tcb_ptr, len(tcb),
                 closed,
-            ),
-            _lib.asdf_cubiccurve2_free)
-        super().__init__(ptr)
+            )
+        else:
+            ptr = _lib.asdf_centripetalkochanekbartelsspline2_uniform_tcb(
+                positions_ptr, len(positions), *uniform_tcb, closed)
+        super().__init__(_ffi.gc(ptr, _lib.asdf_cubiccurve2_free))
+
+    @classmethod
+    def from_batch(cls, positions_list, *, tcb_list=None, closed=False):
+        """Create one spline per list of positions, sharing one buffer."""
+        return _kochanek_bartels_batch(
+            cls, 2, _lib.asdf_centripetalkochanekbartelsspline2,
+            _lib.asdf_cubiccurve2_free, positions_list, tcb_list, closed)
 
 
 class _CubicCurve1(_FromPtr):
 
-    def evaluate(self, t):
-        return _evaluate(t, (), _lib.asdf_cubiccurve1_evaluate, self._ptr)
+    _evaluate_fn = _evaluate_fn_1d
+
+    def evaluate(self, t, out=None, *, chunk=None, dtype=None,
+                 parallel=False):
+        return _evaluate(
+            t, (), _lib.asdf_cubiccurve1_evaluate, self._ptr, out, chunk,
+            dtype, parallel)
+
+    def evaluate_uniform(self, n_per_segment, out=None):
+        """Evaluate n_per_segment points per segment, plus the end point."""
+        return _evaluate_uniform(
+            n_per_segment, (), _lib.asdf_cubiccurve1_evaluate_uniform,
+            self._ptr, len(self.grid) - 1, out)
+
+    def evaluate_grid(self, out=None):
+        """Evaluate the spline at all elements of its grid."""
+        return _evaluate_grid(
+            (), _lib.asdf_cubiccurve1_evaluate_grid, self._ptr,
+            len(self.grid), out)
 
     @property
     def grid(self):
-        return _grid(_lib.asdf_cubiccurve1_grid, self._ptr)
+        if self._grid is None:
+            self._grid = _fetch_grid(_lib.asdf_cubiccurve1_grid, self._ptr)
+        return self._grid
 
 
 class ShapePreservingCubicSpline(_CubicCurve1):
 
     def __init__(self, values, *, slopes=None, grid=None, closed=False):
         values, values_ptr = _make_buffer(1, values, 'values')
-        if grid is None:
-            grid = _np.arange(len(values) + closed, dtype='float32')
-        grid, grid_ptr = _make_buffer(1, grid, 'grid')
-        if slopes is None:
+        if grid is None and slopes is None:
+            ptr = _ffi.gc(
+                _lib.asdf_shapepreservingcubicspline_uniform(
+                    values_ptr, len(values), closed),
+                _lib.asdf_cubiccurve1_free)
+        elif slopes is None:
+            grid, grid_ptr = _make_buffer(1, grid, 'grid')
             ptr = _ffi.gc(
                 _lib.asdf_shapepreservingcubicspline(
                     values_ptr, len(values),
@@ -232,6 +706,9 @@ class ShapePreservingCubicSpline(_CubicCurve1):
                 ),
                 _lib.asdf_cubiccurve1_free)
         else:
+            if grid is None:
+                grid = _np.arange(len(values) + closed, dtype='float32')
+            grid, grid_ptr = _make_buffer(1, grid, 'grid')
             slopes, slopes_ptr = _make_buffer(1, slopes, 'slopes')
             ptr = _ffi.gc(
                 _lib.asdf_shapepreservingcubicspline_with_slopes(
@@ -248,10 +725,12 @@ class MonotoneCubicSpline(_CubicCurve1):
 
     def __init__(self, values, *, slopes=None, grid=None):
         values, values_ptr = _make_buffer(1, values, 'values')
-        if grid is None:
-            grid = _np.arange(len(values), dtype='float32')
-        grid, grid_ptr = _make_buffer(1, grid, 'grid')
-        if slopes is None:
+        if grid is None and slopes is None:
+            ptr = _ffi.gc(
+                _lib.asdf_monotonecubic_uniform(values_ptr, len(values)),
+                _lib.asdf_monotonecubic_free)
+        elif slopes is None:
+            grid, grid_ptr = _make_buffer(1, grid, 'grid')
             ptr = _ffi.gc(
                 _lib.asdf_monotonecubic(
                     values_ptr, len(values),
@@ -259,6 +738,9 @@ class MonotoneCubicSpline(_CubicCurve1):
                 ),
                 _lib.asdf_monotonecubic_free)
         else:
+            if grid is None:
+                grid = _np.arange(len(values), dtype='float32')
+            grid, grid_ptr = _make_buffer(1, grid, 'grid')
             slopes, slopes_ptr = _make_buffer(1, slopes, 'slopes')
             ptr = _ffi.gc(
                 _lib.asdf_monotonecubic_with_slopes(
@@ -268,15 +750,68 @@ class MonotoneCubicSpline(_CubicCurve1):
                 ),
                 _lib.asdf_monotonecubic_free)
         super().__init__(ptr)  # Just for error-handling
-        self._monotone_ptr = ptr
+        self._monotone = ptr
         super().__init__(_lib.asdf_monotonecubic_inner(ptr))
 
-    def get_time(self, values):
-        values = _np.ascontiguousarray(values, dtype='float32')
-        output = _np.empty_like(values)
+    def close(self):
+        # NB: self._cdata is not owned, it points into self._monotone
+        monotone, self._monotone = self._monotone, None
+        if monotone is not None:
+            _ffi.release(monotone)
+        self._cdata = None
+        self._grid = None
+
+    @property
+    def _monotone_ptr(self):
+        if self._monotone is None:
+            raise ValueError('spline is closed')
+        return self._monotone
+
+    def get_time(self, values, out=None):
+        if out is None and isinstance(values, _SCALAR):
+            return _lib.asdf_monotonecubic_get_time_scalar(
+                self._monotone_ptr, values)
+        values = _as_f32_contig(values)
+        if out is None:
+            out = _np.empty_like(values)
+        else:
+            _check_out(out, values.shape, source=values)
         _lib.asdf_monotonecubic_get_time(
             self._monotone_ptr,
-            _ffi.from_buffer('float[]', values),
+            _input_ptr(values),
             values.size,
-            _ffi.from_buffer('float[]', output))
-        return output
+            _ffi.from_buffer('float[]', out))
+        return out
+
+
+def batch_evaluate(splines, t, out=None, *, parallel=False):
+    """Evaluate multiple splines of the same kind at the same time(s)."""
+    splines = list(splines)
+    for base, (cdecl, extra_dim, func) in _EVALUATE_BATCH.items():
+        if all(isinstance(s, base) for s in splines):
+            break
+    else:
+        raise TypeError('splines must all be of the same kind')
+    t = _as_f32_contig(t)
+    shape = (len(splines),) + t.shape + extra_dim
+    if out is None:
+        out = _np.empty(shape, dtype=_np.float32)
+    else:
+        _check_out(out, shape, source=t)
+    func(
+        _ffi.new(cdecl, [s._ptr for s in splines]), len(splines),
+        _input_ptr(t), t.size,
+        _ffi.from_buffer('float[]', out), parallel)
+    return out
+
+
+_EVALUATE_BATCH = {
+    AsdfSpline: (
+        'AsdfPosSpline3 *[]', (3,), _lib.asdf_asdfposspline3_evaluate_batch),
+    _CubicCurve3: (
+        'AsdfCubicCurve3 *[]', (3,), _lib.asdf_cubiccurve3_evaluate_batch),
+    _CubicCurve2: (
+        'AsdfCubicCurve2 *[]', (2,), _lib.asdf_cubiccurve2_evaluate_batch),
+    _CubicCurve1: (
+        'AsdfCubicCurve1 *[]', (), _lib.asdf_cubiccurve1_evaluate_batch),
+}
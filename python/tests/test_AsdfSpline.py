@@ -0,0 +1,130 @@
+from asdfspline import AsdfSpline
+import numpy as np
+import pytest
+
+
+def test_from_arrays():
+    vertices = [
+        {'position': (0, 0, 0)},
+        {'position': (1, 1, 0), 'time': 2, 'tension': 0.5},
+        {'position': (2, 0, 0), 'time': 3},
+    ]
+    expected = AsdfSpline(vertices)
+    s = AsdfSpline.from_arrays(
+        [[0, 0, 0], [1, 1, 0], [2, 0, 0]],
+        times=[np.nan, 2, 3],
+        tcb=[[0.5, 0, 0]],
+    )
+    np.testing.assert_array_equal(s.grid, expected.grid)
+    np.testing.assert_array_equal(
+        s.evaluate([0, 1, 2.5]), expected.evaluate([0, 1, 2.5]))
+
+
+def test_from_arrays_2d():
+    positions = np.array([[0, 0], [1, 1], [2, 0]], dtype='float32')
+    s = AsdfSpline.from_arrays(positions, times=[0, np.nan, 3])
+    expected = AsdfSpline.from_arrays(
+        np.pad(positions, [(0, 0), (0, 1)]), times=[0, np.nan, 3])
+    np.testing.assert_array_equal(s.grid, expected.grid)
+    np.testing.assert_array_equal(
+        s.evaluate([0, 1, 2.5]), expected.evaluate([0, 1, 2.5]))
+
+
+def test_closed_vertices():
+    positions = [[0, 0, 0], [1, 1, 0], [2, 0, 0]]
+    vertices = [{'position': p} for p in positions]
+    vertices[1]['time'] = 2
+    s = AsdfSpline(vertices + [{'position': 'closed', 'time': 5}])
+    expected = AsdfSpline.from_arrays(
+        positions, times=[np.nan, 2, np.nan, 5], closed=True)
+    np.testing.assert_array_equal(s.grid, expected.grid)
+    np.testing.assert_array_equal(
+        s.evaluate([0, 1, 4.5]), expected.evaluate([0, 1, 4.5]))
+    # NB: Without a closing time, the same error is raised by both
+    with pytest.raises(ValueError, match='last time value'):
+        AsdfSpline(vertices + [{'position': 'closed'}])
+    with pytest.raises(ValueError, match='last time value'):
+        AsdfSpline.from_arrays(
+            positions, times=[np.nan, 2, np.nan, np.nan], closed=True)
+
+
+def test_2d_vertices():
+    s = AsdfSpline([
+        {'position': (0, 0)},
+        {'position': (1, 1), 'time': 2},
+        {'position': (2, 0, 0), 'time': 3},
+    ])
+    expected = AsdfSpline([
+        {'position': (0, 0, 0)},
+        {'position': (1, 1, 0), 'time': 2},
+        {'position': (2, 0, 0), 'time': 3},
+    ])
+    np.testing.assert_array_equal(s.grid, expected.grid)
+    np.testing.assert_array_equal(
+        s.evaluate([0, 1, 2.5]), expected.evaluate([0, 1, 2.5]))
+
+
+def test_vertices_errors():
+    vertices = [{'position': (0, 0, 0)}, {'position': (1, 1, 0), 'time': 2}]
+    with pytest.raises(ValueError, match='only allowed string'):
+        AsdfSpline(vertices + [{'position': 'open', 'time': 3}])
+    with pytest.raises(ValueError, match='only time is allowed'):
+        AsdfSpline(vertices + [{'position': 'closed', 'speed': 1}])
+    for key in 'time', 'speed', 'tension', 'continuity', 'bias':
+        with pytest.raises(TypeError, match=key + ' values must be scalars'):
+            AsdfSpline(vertices + [{'position': (2, 0, 0), key: '3'}])
+
+
+def test_structured_array():
+    data = np.zeros(3, dtype=[
+        ('position', 'float32', 3), ('time', 'float32'), ('bias', 'float32')])
+    data['position'] = [[0, 0, 0], [1, 1, 0], [2, 0, 0]]
+    data['time'] = [0, 2, 3]
+    data['bias'][1] = 0.5
+    expected = AsdfSpline.from_arrays(
+        data['position'], times=data['time'], tcb=[[0, 0, 0.5]])
+    np.testing.assert_array_equal(AsdfSpline(data).grid, expected.grid)
+    data['bias'][0] = 1
+    with pytest.raises(ValueError, match='first vertex cannot have'):
+        AsdfSpline(data)
+
+
+def test_dict():
+    positions = [[0, 0, 0], [1, 1, 0], [2, 0, 0]]
+    # NB: Missing optional keys are not a TypeError
+    with pytest.raises(ValueError, match='last time value'):
+        AsdfSpline({'positions': positions})
+    s = AsdfSpline({'positions': positions, 'times': [0, np.nan, 3]})
+    expected = AsdfSpline.from_arrays(positions, times=[0, np.nan, 3])
+    np.testing.assert_array_equal(s.grid, expected.grid)
+
+
+def test_python_errors():
+    with pytest.raises(ValueError, match='times.*one-dimensional'):
+        AsdfSpline.from_arrays([[0, 0, 0], [1, 1, 1]], times=[[0, 1]])
+    with pytest.raises(ValueError, match='invalid key'):
+        AsdfSpline({'position': [[0, 0, 0], [1, 1, 1]]})
+    with pytest.raises(ValueError, match='positions must be given'):
+        AsdfSpline({'times': [0, 1]})
+    with pytest.raises(ValueError, match='invalid key'):
+        AsdfSpline(np.zeros(2, dtype=[
+            ('position', 'float32', 3), ('tcb', 'float32', 3)]))
+
+
+def test_evaluate_grid():
+    s = AsdfSpline([
+        {'position': (0, 0, 0)},
+        {'position': (1, 1, 0), 'time': 2},
+        {'position': (2, 0, 0), 'time': 3},
+    ])
+    np.testing.assert_array_equal(s.evaluate_grid(), s.evaluate(s.grid))
+
+
+def test_tcb_nan():
+    vertices = [
+        {'position': (0, 0, 0), 'tension': np.nan},
+        {'position': (1, 1, 0), 'time': 2},
+        {'position': (2, 0, 0), 'time': 3},
+    ]
+    with pytest.raises(ValueError, match='first vertex cannot have'):
+        AsdfSpline(vertices)
@@ -1,4 +1,5 @@
-from asdfspline import CentripetalKochanekBartelsSpline2
+from asdfspline import CentripetalKochanekBartelsSpline2, batch_evaluate
+import numpy as np
 import pytest
 
 
@@ -29,3 +30,122 @@ def test_python_errors():
         CentripetalKochanekBartelsSpline2([[0, 0], [1, 1]], tcb=0)
     with pytest.raises(ValueError, match='TCB.*list of triples'):
         CentripetalKochanekBartelsSpline2([[0, 0], [1, 1]], tcb=[0])
+
+
+def test_evaluate_out():
+    s = CentripetalKochanekBartelsSpline2([[0, 0], [1, 1]])
+    out = np.empty((3, 2), dtype='float32')
+    assert s.evaluate([0, 0.5, 1], out=out) is out
+    np.testing.assert_array_equal(out, s.evaluate([0, 0.5, 1]))
+    with pytest.raises(ValueError, match='out.*shape'):
+        s.evaluate([0, 1], out=out)
+    with pytest.raises(ValueError, match='out.*float32'):
+        s.evaluate([0, 0.5, 1], out=np.empty((3, 2)))
+    with pytest.raises(ValueError, match='out.*C-contiguous'):
+        s.evaluate([0, 0.5, 1], out=np.empty((2, 3), dtype='float32').T)
+
+
+def test_from_batch():
+    positions_list = [[[0, 0], [1, 1], [2, 0]], [[0, 0], [1, 2]]]
+    tcb_list = [[[0.5, 0, 0]], None]
+    splines = CentripetalKochanekBartelsSpline2.from_batch(
+        positions_list, tcb_list=tcb_list)
+    assert len(splines) == 2
+    for s, positions, tcb in zip(splines, positions_list, tcb_list):
+        expected = CentripetalKochanekBartelsSpline2(positions, tcb=tcb)
+        np.testing.assert_array_equal(s.grid, expected.grid)
+    with pytest.raises(ValueError, match='number of TCB lists'):
+        CentripetalKochanekBartelsSpline2.from_batch(
+            positions_list, tcb_list=[None])
+
+
+def test_evaluate_uniform():
+    s = CentripetalKochanekBartelsSpline2([[0, 0], [1, 1], [3, 0]])
+    t0, t1, t2 = s.grid
+    times = np.concatenate([
+        np.linspace(t0, t1, 4, endpoint=False),
+        np.linspace(t1, t2, 4, endpoint=False),
+        [t2],
+    ])
+    np.testing.assert_allclose(
+        s.evaluate_uniform(4), s.evaluate(times), rtol=1e-5, atol=1e-6)
+    with pytest.raises(ValueError, match='n_per_segment'):
+        s.evaluate_uniform(0)
+
+
+def test_close():
+    positions = [[0, 0], [1, 1]]
+    with CentripetalKochanekBartelsSpline2(positions) as s:
+        s.evaluate(0.5)
+        grid = s.grid
+    np.testing.assert_array_equal(
+        grid, CentripetalKochanekBartelsSpline2(positions).grid)
+    for method in s.evaluate, s.evaluate_uniform:
+        with pytest.raises(ValueError, match='spline is closed'):
+            method(1)
+    with pytest.raises(ValueError, match='spline is closed'):
+        s.grid
+    with pytest.raises(ValueError, match='spline is closed'):
+        batch_evaluate([s], 0.5)
+    s.close()  # Closing twice is allowed
+
+
+def test_evaluate_grid():
+    s = CentripetalKochanekBartelsSpline2([[0, 0], [1, 1], [3, 0]])
+    np.testing.assert_allclose(
+        s.evaluate_grid(), s.evaluate(s.grid), rtol=1e-5, atol=1e-6)
+
+
+def test_batch_evaluate():
+    splines = [
+        CentripetalKochanekBartelsSpline2([[0, 0], [1, 1]]),
+        CentripetalKochanekBartelsSpline2([[0, 0], [1, 2], [3, 1]]),
+    ]
+    t = [0, 0.5, 1]
+    expected = [s.evaluate(t) for s in splines]
+    np.testing.assert_array_equal(batch_evaluate(splines, t), expected)
+    np.testing.assert_array_equal(
+        batch_evaluate(splines, t, parallel=True), expected)
+    with pytest.raises(TypeError, match='same kind'):
+        batch_evaluate([splines[0], 42], t)
+
+
+def test_evaluate_many():
+    s = CentripetalKochanekBartelsSpline2([[0, 0], [1, 1], [3, 0]])
+    # NB: Large inputs are evaluated in parallel chunks of 1024 elements
+    t = np.linspace(-0.5, 2.5, 3 * 1024 + 7, dtype='float32')
+    expected = np.concatenate([s.evaluate(t[i:i + 1]) for i in range(t.size)])
+    np.testing.assert_array_equal(s.evaluate(t), expected)
+    np.testing.assert_array_equal(s.evaluate(t, parallel=True), expected)
+    np.testing.assert_array_equal(
+        s.evaluate(t, dtype='float16', parallel=True),
+        expected.astype('float16'))
+
+
+def test_evaluate_float16():
+    s = CentripetalKochanekBartelsSpline2([[0, 0], [1, 1], [3, 0]])
+    t = np.linspace(0, s.grid[-1], 11)
+    expected = s.evaluate(t).astype('float16')
+    np.testing.assert_array_equal(s.evaluate(t, dtype='float16'), expected)
+    out = np.empty((11, 2), dtype='float16')
+    assert s.evaluate(t, out=out, dtype='float16') is out
+    np.testing.assert_array_equal(out, expected)
+    np.testing.assert_array_equal(
+        s.evaluate(t, chunk=4, dtype='float16'), expected)
+    with pytest.raises(ValueError, match='out.*float16'):
+        s.evaluate(t, out=np.empty((11, 2), dtype='float32'), dtype='float16')
+    with pytest.raises(ValueError, match='dtype must be float32 or float16'):
+        s.evaluate(t, dtype='float64')
+
+
+def test_evaluate_chunk():
+    s = CentripetalKochanekBartelsSpline2([[0, 0], [1, 1], [3, 0]])
+    t = np.linspace(0, s.grid[-1], 14).reshape(2, 7)
+    np.testing.assert_array_equal(s.evaluate(t, chunk=4), s.evaluate(t))
+    np.testing.assert_array_equal(s.evaluate(t.T, chunk=4), s.evaluate(t.T))
+    t = np.linspace(0, s.grid[-1], 30)[::3]  # Non-contiguous float64
+    np.testing.assert_array_equal(s.evaluate(t, chunk=3), s.evaluate(t))
+    np.testing.assert_array_equal(
+        s.evaluate(t.tolist(), chunk=3), s.evaluate(t))
+    with pytest.raises(ValueError, match='chunk must be a positive integer'):
+        s.evaluate(t, chunk=0)
@@ -0,0 +1,13 @@
+from asdfspline import CentripetalKochanekBartelsSpline3
+import numpy as np
+
+
+def test_fortran_order():
+    positions = [[0, 0, 0], [1, 1, 0], [2, 0, 1], [3, 1, 1]]
+    tcb = [[0.5, 0, 0], [0, -0.5, 0.25]]
+    expected = CentripetalKochanekBartelsSpline3(positions, tcb=tcb)
+    s = CentripetalKochanekBartelsSpline3(
+        np.asfortranarray(positions, dtype='float32'), tcb=tcb)
+    np.testing.assert_array_equal(s.grid, expected.grid)
+    np.testing.assert_array_equal(
+        s.evaluate([0, 1.5, 4]), expected.evaluate([0, 1.5, 4]))
@@ -0,0 +1,45 @@
+from asdfspline import MonotoneCubicSpline
+import numpy as np
+import pytest
+
+
+def test_get_time_scalar():
+    s = MonotoneCubicSpline([0, 1, 1, 3], grid=[0, 2, 3, 4])
+    assert s.get_time(0) == 0
+    assert isinstance(s.get_time(np.float32(0)), float)
+    assert s.get_time(5) == 4  # Out of range
+    assert np.isnan(s.get_time(1))  # Not unique
+
+
+def test_get_time_array():
+    s = MonotoneCubicSpline([0, 1, 1, 3], grid=[0, 2, 3, 4])
+    values = np.array([[0, 1], [3, 5]], dtype='float32')
+    times = s.get_time(values)
+    assert times.shape == values.shape
+    assert times[0, 0] == 0
+    assert np.isnan(times[0, 1])
+    np.testing.assert_array_equal(times[1], [4, 4])
+    t = s.get_time([0.5, 2])
+    np.testing.assert_allclose(s.evaluate(t), [0.5, 2], atol=1e-3)
+
+
+def test_get_time_out():
+    s = MonotoneCubicSpline([0, 1, 3])
+    out = np.empty(3, dtype='float32')
+    assert s.get_time([0, 1, 3], out=out) is out
+    np.testing.assert_array_equal(out, [0, 1, 2])
+    with pytest.raises(ValueError, match='out.*shape'):
+        s.get_time([0, 1], out=out)
+    values = np.array([0, 1, 3], dtype='float32')
+    with pytest.raises(ValueError, match='out must not overlap'):
+        s.get_time(values, out=values)
+
+
+def test_close():
+    s = MonotoneCubicSpline([0, 1, 3])
+    s.close()
+    with pytest.raises(ValueError, match='spline is closed'):
+        s.get_time(0.5)
+    with pytest.raises(ValueError, match='spline is closed'):
+        s.evaluate(0.5)
+    s.close()  # Closing twice is allowed
@@ -38,3 +38,19 @@ def test_python_errors():
         ShapePreservingCubicSpline([0, 1], grid=[[0]])
     with pytest.raises(ValueError, match='slopes.*one-dimensional'):
         ShapePreservingCubicSpline([0, 1], slopes=[[0]])
+
+
+def test_default_grid():
+    s = ShapePreservingCubicSpline([0, 1, 3])
+    np.testing.assert_array_equal(s.grid, [0, 1, 2])
+    s = ShapePreservingCubicSpline([0, 1, 3], closed=True)
+    np.testing.assert_array_equal(s.grid, [0, 1, 2, 3])
+
+
+def test_out_overlap():
+    s = ShapePreservingCubicSpline([0, 1, 3])
+    t = np.array([0, 0.5, 1, 2], dtype='float32')
+    with pytest.raises(ValueError, match='out must not overlap'):
+        s.evaluate(t, out=t)
+    with pytest.raises(ValueError, match='out must not overlap'):
+        s.evaluate(t, out=t, chunk=2)
@@ -0,0 +1,67 @@
+import ctypes
+
+from asdfspline import (
+    AsdfSpline,
+    CentripetalKochanekBartelsSpline2,
+    CentripetalKochanekBartelsSpline3,
+    MonotoneCubicSpline,
+    ShapePreservingCubicSpline,
+)
+import numpy as np
+import pytest
+
+# NB: The constructor argument of an example spline for each class
+EXAMPLES = {
+    AsdfSpline: {
+        'positions': [[0, 0, 0], [1, 1, 0], [2, 0, 0]],
+        'times': [0, np.nan, 3],
+    },
+    CentripetalKochanekBartelsSpline2: [[0, 0], [1, 1], [3, 0]],
+    CentripetalKochanekBartelsSpline3: [[0, 0, 0], [1, 1, 0], [2, 0, 1]],
+    MonotoneCubicSpline: [0, 1, 3],
+    ShapePreservingCubicSpline: [0, 1, 3],
+}
+
+
+def parametrize_classes(classes):
+    return pytest.mark.parametrize(
+        'cls', classes, ids=lambda cls: cls.__name__)
+
+
+# NB: The special cases are tested with CentripetalKochanekBartelsSpline2
+@parametrize_classes([
+    cls for cls in EXAMPLES if cls is not CentripetalKochanekBartelsSpline2])
+def test_evaluate_float16(cls):
+    s = cls(EXAMPLES[cls])
+    t = np.linspace(0, s.grid[-1], 11)
+    np.testing.assert_array_equal(
+        s.evaluate(t, dtype='float16'), s.evaluate(t).astype('float16'))
+
+
+@parametrize_classes([
+    CentripetalKochanekBartelsSpline2, CentripetalKochanekBartelsSpline3])
+@pytest.mark.parametrize('closed', [False, True])
+def test_uniform_tcb(cls, closed):
+    positions = EXAMPLES[cls]
+    N = len(positions) if closed else len(positions) - 2
+    tcb = (0.5, -0.25, 0.125)
+    s = cls(positions, tcb=tcb, closed=closed)
+    expected = cls(positions, tcb=np.tile(tcb, (N, 1)), closed=closed)
+    np.testing.assert_array_equal(s.grid, expected.grid)
+    t = np.linspace(0, s.grid[-1], 9)
+    np.testing.assert_array_equal(s.evaluate(t), expected.evaluate(t))
+    expected = cls(positions, tcb=np.zeros((N, 3)), closed=closed)
+    s = cls(positions, closed=closed)
+    np.testing.assert_array_equal(s.evaluate(t), expected.evaluate(t))
+
+
+@parametrize_classes(list(EXAMPLES))
+def test_raw_evaluate(cls):
+    s = cls(EXAMPLES[cls])
+    t = np.linspace(0, s.grid[-1], 7, dtype='float32')
+    expected = s.evaluate(t)
+    out = np.zeros_like(expected)
+    float_ptr = ctypes.POINTER(ctypes.c_float)
+    s._raw_evaluate(
+        t.ctypes.data_as(float_ptr), t.size, out.ctypes.data_as(float_ptr))
+    np.testing.assert_array_equal(out, expected)
@@ -41,6 +41,48 @@ impl<V: Vector> PiecewiseCubicCurve<V> {
         &self.segments
     }
 
+    /// Evaluates `n` equally spaced points per segment, followed by the end point.
+    ///
+    /// See `evaluate_uniform_into()`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `n` is zero.
+    pub fn evaluate_uniform(&self, n: usize) -> Vec<V> {
+        let mut result = vec![self.segments[0][0]; self.segments.len() * n + 1];
+        self.evaluate_uniform_into(n, &mut result);
+        result
+    }
+
+    /// Writes `n` equally spaced points per segment, followed by the end point, into `output`.
+    ///
+    /// Each segment is evaluated at its start and at `n - 1` points in between.
+    /// The powers of the (normalized) parameter are computed only once
+    /// and are shared by all segments.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `n` is zero or if the length of `output`
+    /// is not `n` times the number of segments plus one.
+    pub fn evaluate_uniform_into(&self, n: usize, output: &mut [V]) {
+        assert!(n > 0, "number of points per segment must be positive");
+        assert_eq!(output.len(), self.segments.len() * n + 1);
+        let powers: Vec<[f32; 4]> = (0..n)
+            .map(|i| {
+                let t = i as f32 / n as f32;
+                [1.0, t, t * t, t * t * t]
+            })
+            .collect();
+        let (last, output) = output.split_last_mut().unwrap();
+        for (a, output) in self.segments.iter().zip(output.chunks_exact_mut(n)) {
+            for (p, out) in powers.iter().zip(output) {
+                *out = a[0] * p[0] + a[1] * p[1] + a[2] * p[2] + a[3] * p[3];
+            }
+        }
+        let a = &self.segments[self.segments.len() - 1];
+        *last = a[0] + a[1] + a[2] + a[3];
+    }
+
     // If t is out of bounds, it is trimmed to the smallest/largest possible value
     fn get_segment(&self, t: f32) -> (f32, f32, f32, &[V; 4]) {
         let (t, idx) = self.clamp_parameter_and_find_index(t);
@@ -103,6 +145,16 @@ mod tests {
         assert_eq!(curve.evaluate(6.5), 10.5); // last < t
     }
 
+    #[test]
+    fn evaluate_uniform() {
+        let curve = make_simple_curve();
+        assert_eq!(curve.evaluate_uniform(1), vec![1.0, 10.5]);
+        assert_eq!(curve.evaluate_uniform(2), vec![1.0, 3.5, 10.5]);
+        let mut output = [0.0; 3];
+        curve.evaluate_uniform_into(2, &mut output);
+        assert_eq!(output, [1.0, 3.5, 10.5]);
+    }
+
     #[test]
     fn evaluate_velocity() {
         let curve = make_simple_curve();